@@ -7,7 +7,7 @@ import attr
 from airflow_monitor.shared.base_monitor_config import NOTHING, BaseMonitorState
 
 
-@attr.s
+@attr.s(slots=True)
 class LastSeenValues:
     last_seen_dag_run_id = attr.ib()  # type: Optional[int]
     last_seen_log_id = attr.ib()  # type: Optional[int]
@@ -70,7 +70,7 @@ class MonitorState(BaseMonitorState):
     api_mode = attr.ib(default=NOTHING)
 
 
-@attr.s
+@attr.s(slots=True)
 class AirflowDagRun:
     id = attr.ib()  # type: int
     dag_id = attr.ib()  # type: str
@@ -81,8 +81,23 @@ class AirflowDagRun:
     max_log_id = attr.ib()  # type: int
     events = attr.ib(default=None)  # type: str
 
-
-@attr.s
+    @classmethod
+    def from_dict(cls, data):
+        # built from trusted json on every monitor poll - skip attrs __init__
+        obj = cls.__new__(cls)
+        get = data.get
+        obj.id = get("id")
+        obj.dag_id = get("dag_id")
+        obj.execution_date = get("execution_date")
+        obj.state = get("state")
+        obj.is_paused = get("is_paused")
+        obj.has_updated_task_instances = get("has_updated_task_instances")
+        obj.max_log_id = get("max_log_id")
+        obj.events = None
+        return obj
+
+
+@attr.s(slots=True, frozen=True)
 class AirflowDagRunsResponse:
     dag_runs = attr.ib()  # type: List[AirflowDagRun]
     last_seen_dag_run_id = attr.ib()  # type: Optional[int]
@@ -90,25 +105,15 @@ class AirflowDagRunsResponse:
 
     @classmethod
     def from_dict(cls, data):
+        dag_run_from_dict = AirflowDagRun.from_dict
         return cls(
-            dag_runs=[
-                AirflowDagRun(
-                    id=dr.get("id"),
-                    dag_id=dr.get("dag_id"),
-                    execution_date=dr.get("execution_date"),
-                    state=dr.get("state"),
-                    is_paused=dr.get("is_paused"),
-                    has_updated_task_instances=dr.get("has_updated_task_instances"),
-                    max_log_id=dr.get("max_log_id"),
-                )
-                for dr in data.get("new_dag_runs") or []
-            ],
+            dag_runs=[dag_run_from_dict(dr) for dr in data.get("new_dag_runs") or []],
             last_seen_dag_run_id=data.get("last_seen_dag_run_id"),
             last_seen_log_id=data.get("last_seen_log_id"),
         )
 
 
-@attr.s
+@attr.s(slots=True, frozen=True)
 class DagRunsFullData:
     dags = attr.ib()
     dag_runs = attr.ib()
@@ -122,13 +127,13 @@ class DagRunsFullData:
     @classmethod
     def from_dict(cls, data):
         return cls(
-            dags=list(data.get("dags")),
-            dag_runs=list(data.get("dag_runs")),
-            task_instances=list(data.get("task_instances")),
+            dags=list(data.get("dags") or ()),
+            dag_runs=list(data.get("dag_runs") or ()),
+            task_instances=list(data.get("task_instances") or ()),
         )
 
 
-@attr.s
+@attr.s(slots=True, frozen=True)
 class DagRunsStateData:
     dag_runs = attr.ib()
     task_instances = attr.ib()
@@ -139,6 +144,6 @@ class DagRunsStateData:
     @classmethod
     def from_dict(cls, data):
         return cls(
-            task_instances=list(data.get("task_instances")),
-            dag_runs=list(data.get("dag_runs")),
+            task_instances=list(data.get("task_instances") or ()),
+            dag_runs=list(data.get("dag_runs") or ()),
         )
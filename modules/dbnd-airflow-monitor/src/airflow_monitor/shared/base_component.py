@@ -8,6 +8,7 @@ from prometheus_client import Summary
 
 from airflow_monitor.shared.base_server_monitor_config import BaseServerConfig
 from airflow_monitor.shared.base_tracking_service import BaseTrackingService
+from airflow_monitor.shared.error_handler import capture_component_exception
 from airflow_monitor.shared.integration_management_service import (
     IntegrationManagementService,
 )
@@ -56,8 +57,6 @@ class BaseComponent:
             logging.root.setLevel(self.config.log_level)
 
     def sync_once(self):
-        from airflow_monitor.shared.error_handler import capture_component_exception
-
         logger.info(
             "Starting sync_once on tracking source uid: %s, syncer: %s",
             self.config.tracking_source_uid,
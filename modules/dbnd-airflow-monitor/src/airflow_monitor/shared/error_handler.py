@@ -2,12 +2,12 @@
 
 import logging
 import traceback
+import typing
 
 from contextlib import contextmanager
 from datetime import timedelta
 from uuid import UUID
 
-from airflow_monitor.shared.base_component import BaseComponent
 from airflow_monitor.shared.integration_management_service import (
     IntegrationManagementService,
 )
@@ -15,11 +15,15 @@ from dbnd._core.utils.timezone import utcnow
 from dbnd._vendor.cachetools import TTLCache, cached
 
 
+if typing.TYPE_CHECKING:
+    from airflow_monitor.shared.base_component import BaseComponent
+
+
 logger = logging.getLogger(__name__)
 
 
 @contextmanager
-def capture_component_exception(component: BaseComponent, function_name: str):
+def capture_component_exception(component: "BaseComponent", function_name: str):
     syncer_logger = getattr(component.__module__, "logger", None) or logging.getLogger(
         component.__module__
     )
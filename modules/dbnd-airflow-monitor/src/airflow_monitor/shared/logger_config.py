@@ -10,14 +10,16 @@ try:
 except ImportError:
     JsonFormatter = None
 
+LOG_FORMAT = (
+    "[%(asctime)s] %(levelname)s %(name)s %(process)s %(threadName)s : %(message)s"
+)
+
 
 def configure_logging(use_json: bool):
     if use_json and JsonFormatter:
         formatter = JsonFormatter()
     else:
-        formatter = logging.Formatter(
-            "[%(asctime)s] %(levelname)s %(name)s %(process)s %(threadName)s : %(message)s"
-        )
+        formatter = logging.Formatter(LOG_FORMAT)
     log_handler = logging.StreamHandler(stream=sys.stdout)
     log_handler.setFormatter(formatter)
     # need to reset dbnd logger, remove after dbnd._core removed
@@ -26,5 +28,8 @@ def configure_logging(use_json: bool):
     # TODO: should be removed after dbnd-core separation from monitor
     os.environ.setdefault("DBND__LOG__DISABLED", "true")
 
+    # processName is not used by any of our formatters, skip resolving it per record
+    logging.logMultiprocessing = False
+
     logging.root.addHandler(log_handler)
     logging.root.setLevel(logging.INFO)
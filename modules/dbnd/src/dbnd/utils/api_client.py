@@ -3,16 +3,19 @@
 import gzip
 import json
 import logging
+import random
 import uuid
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from http import HTTPStatus
 from time import sleep
 from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urljoin
 
 import requests
 
-from six.moves.urllib_parse import urljoin
+from requests.adapters import HTTPAdapter
 
 from dbnd import __version__
 from dbnd._core.current import try_get_databand_run
@@ -31,8 +34,17 @@ from dbnd.utils.trace import get_tracing_id
 # we'd like to have all requests with default timeout, just in case it's stuck
 DEFAULT_REQUEST_TIMEOUT = 300
 DEFAULT_SESSION_KEY_ERROR_MAX_RETRY = 3
+DEFAULT_SESSION_POOL_SIZE = 16
+# error pages (html, stack traces) can be huge, we keep only the head of it
+MAX_ERROR_RESPONSE_SIZE = 8192
+# health check should answer fast, no need to wait for the default request timeout
+PING_REQUEST_TIMEOUT = 5
 logger = logging.getLogger(__name__)
 
+# the same handful of endpoints are requested over and over again,
+# no need to re-parse both parts of the url on every call
+_urljoin = lru_cache(maxsize=512)(urljoin)
+
 
 # uncomment for requests trace
 # import http.client
@@ -59,6 +71,7 @@ class ApiClient(object):
         extra_default_headers: Optional[Dict[str, str]] = None,
         ignore_ssl_errors: bool = False,
         default_session_key_error_max_retry=DEFAULT_SESSION_KEY_ERROR_MAX_RETRY,
+        session_pool_size: int = DEFAULT_SESSION_POOL_SIZE,
     ):
         """
         @param api_base_url: databand webserver url to build the request with
@@ -72,6 +85,7 @@ class ApiClient(object):
             data before giving up, as a float, or a :ref:`(connect timeout,
             read timeout) <timeouts>` tuple
         @param default_session_key_error_max_retry: (Optional): session retry for key_error
+        @param session_pool_size: (Optional): max number of keep-alive connections per host
         """
 
         self._api_base_url = api_base_url
@@ -88,6 +102,8 @@ class ApiClient(object):
         self.session: Optional[requests.Session] = None
         self.session_creation_time = None
         self.session_timeout = session_timeout
+        self.session_pool_size = session_pool_size
+        self._anonymous_session: Optional[requests.Session] = None
 
         self.default_max_retry = default_max_retry
         self.default_retry_sleep = default_retry_sleep
@@ -120,8 +136,9 @@ class ApiClient(object):
         query=None,
         request_timeout=None,
     ):
-        headers = dict(self.default_headers, **(headers or {}))
-        url = urljoin(self._api_base_url, endpoint)
+        # default headers are set on the session, requests merges them with these
+        headers = dict(headers) if headers else {}
+        url = _urljoin(self._api_base_url, endpoint)
 
         headers["X-Request-ID"] = uuid.uuid4().hex
         headers["X-Databand-Trace-ID"] = get_tracing_id().hex
@@ -149,25 +166,27 @@ class ApiClient(object):
                     "Authentication Error: Failed authenticating to Databand server, please check supplied credentials"
                 )
 
+            error_body = resp.content[:MAX_ERROR_RESPONSE_SIZE]
             raise DatabandApiError(
-                method, url, resp.status_code, resp.content.decode("utf-8")
+                method, url, resp.status_code, error_body.decode("utf-8", "replace")
             )
 
-        if resp.content:
-            try:
-                data = resp.json()
-            except Exception as e:
-                logger.info("Failed to get resp.json(). Exception: {}".format(e))
-            else:
-                if self.debug_mode and isinstance(data, dict):
-                    msg = "api_call: {request}\ndebug info:{debug_data}\n".format(
-                        request=resp.request.url, debug_data=data.get("debug")
-                    )
-                    self.webserver_logger.info(msg)
+        if not resp.content:
+            return
+
+        try:
+            data = resp.json()
+        except ValueError as e:
+            logger.info("Failed to get resp.json(). Exception: %s", e)
+            return
 
-                return data
+        if self.debug_mode and isinstance(data, dict):
+            msg = "api_call: {request}\ndebug info:{debug_data}\n".format(
+                request=resp.request.url, debug_data=data.get("debug")
+            )
+            self.webserver_logger.info(msg)
 
-        return
+        return data
 
     def _send_request(self, session, method, url, **kwargs):
         retry_count = self.default_session_key_error_max_retry
@@ -193,7 +212,9 @@ class ApiClient(object):
             credentials = self.credentials
             token = credentials.get("token")
             if token:
-                self.default_headers["Authorization"] = "Bearer {}".format(token)
+                auth_header = "Bearer {}".format(token)
+                self.default_headers["Authorization"] = auth_header
+                self.session.headers["Authorization"] = auth_header
                 return
 
             if "username" in credentials and "password" in credentials:
@@ -213,9 +234,21 @@ class ApiClient(object):
                 "Authentication Error: Failed authenticating to Databand server, please check supplied credentials"
             )
 
+    def _new_session(self) -> requests.Session:
+        session = requests.session()
+        session.headers.update(self.default_headers)
+        # keep-alive connections are reused between calls, size the pool so
+        # concurrent trackers don't drop and re-handshake connections
+        adapter = HTTPAdapter(
+            pool_connections=self.session_pool_size, pool_maxsize=self.session_pool_size
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def create_session(self):
         logger.debug("Initialising session for webserver")
-        self.session = requests.session()
+        self.session = self._new_session()
         self.session_creation_time = datetime.now()
 
     def remove_session(self):
@@ -240,7 +273,7 @@ class ApiClient(object):
             max_retries=self.default_max_retry,
         )
 
-        url = endpoint if no_prefix else urljoin(self.api_prefix, endpoint)
+        url = endpoint if no_prefix else _urljoin(self.api_prefix, endpoint)
 
         retry_number = 0
         while True:
@@ -265,7 +298,10 @@ class ApiClient(object):
                     failure_handler(ex, retry_policy, retry_number)
 
                 if retry_policy.should_retry(500, None, retry_number):
-                    sleep(retry_policy.seconds_to_sleep(retry_number))
+                    # jitter the backoff, so clients that failed together don't
+                    # hit the recovering webserver together again
+                    seconds_to_sleep = retry_policy.seconds_to_sleep(retry_number)
+                    sleep(seconds_to_sleep * (0.5 + random.random()))
                     continue
 
                 self.remove_session()
@@ -273,16 +309,16 @@ class ApiClient(object):
             return resp
 
     def is_ready(self):
+        # single attempt, no retry loop
         try:
-            self.api_request(
-                "auth/ping",
-                None,
+            self._request(
+                _urljoin(self.api_prefix, "auth/ping"),
+                session=self.anonymous_session(),
                 method="GET",
-                requires_auth=False,
-                retry_policy=LinearRetryPolicy(0, 1),
+                request_timeout=PING_REQUEST_TIMEOUT,
             )
             return True
-        except (DatabandConnectionException, DatabandApiError):
+        except (requests.ConnectionError, requests.Timeout, DatabandApiError):
             return False
 
     def has_credentials(self) -> bool:
@@ -301,7 +337,19 @@ class ApiClient(object):
         return self.session
 
     def anonymous_session(self) -> requests.Session:
-        return requests.session()
+        # default headers carry the token once authenticated, strip it so the
+        # cached session stays anonymous for the client lifetime
+        if self._anonymous_session is None:
+            self._anonymous_session = self._new_session()
+            self._anonymous_session.headers.pop("Authorization", None)
+        return self._anonymous_session
+
+    def close(self):
+        for session in (self.session, self._anonymous_session):
+            if session:
+                session.close()
+        self.remove_session()
+        self._anonymous_session = None
 
     def __str__(self):
         return "{}({})".format(self.__class__.__name__, self._api_base_url)
@@ -15,7 +15,8 @@ from dbnd._core.utils.uid_utils import get_uuid
 
 class TestAsyncTracking:
     @patch("dbnd.utils.api_client.ApiClient.api_request")
-    def test_thread_not_started_immideately(self, fake_api_request):
+    @patch("dbnd.utils.api_client.ApiClient._request")
+    def test_thread_not_started_immideately(self, fake_request, fake_api_request):
         ctx = get_databand_context()
         async_store = TrackingStoreThroughChannel.build_with_async_web_channel(ctx)
         assert async_store.is_ready()
@@ -78,7 +79,8 @@ class TestAsyncTracking:
                 fake_skip.assert_not_called()
 
     @patch("dbnd.utils.api_client.ApiClient.api_request")
-    def test_flush_without_worker(self, fake_api_request):
+    @patch("dbnd.utils.api_client.ApiClient._request")
+    def test_flush_without_worker(self, fake_request, fake_api_request):
         ctx = get_databand_context()
         async_store = TrackingStoreThroughChannel.build_with_async_web_channel(ctx)
         assert not async_store.channel._background_worker.is_alive
@@ -9,7 +9,7 @@ import pytest
 import requests
 
 from dbnd._core.utils.http.retry_policy import LinearRetryPolicy
-from dbnd.utils.api_client import ApiClient
+from dbnd.utils.api_client import PING_REQUEST_TIMEOUT, ApiClient
 
 
 class TestApiClient(TestCase):
@@ -95,6 +95,38 @@ class TestApiClient(TestCase):
         sut._send_request(session_instance, "POST", {})
         session_instance.request.assert_has_calls([call("POST", {})])
 
+    def test_is_ready_pings_once(self):
+        sut = self.create_sut(retries=2)
+        assert sut.is_ready()
+        self.network_request_mock.assert_called_once()
+        _, kwargs = self.network_request_mock.call_args
+        assert kwargs["request_timeout"] == PING_REQUEST_TIMEOUT
+
+    def test_is_ready_returns_false_without_retry(self):
+        for error in (
+            self.connection_error,
+            requests.exceptions.Timeout("mocked timeout"),
+        ):
+            self.network_request_mock.reset_mock()
+            self.network_request_mock.side_effect = error
+            sut = self.create_sut(retries=2)
+            with patch("dbnd.utils.api_client.sleep") as sleep_mock:
+                assert not sut.is_ready()
+            self.network_request_mock.assert_called_once()
+            sleep_mock.assert_not_called()
+
+    @mock.patch("dbnd.utils.api_client.HTTPAdapter")
+    def test_anonymous_session_is_reused(self, http_adapter):
+        sut = ApiClient(self.base_url, self.creds, session_pool_size=4)
+        sut.default_headers["Authorization"] = "Bearer token"
+        session = sut.anonymous_session()
+        assert sut.anonymous_session() is session
+        assert "Authorization" not in session.headers
+        http_adapter.assert_called_once_with(pool_connections=4, pool_maxsize=4)
+
+        sut.close()
+        assert sut.anonymous_session() is not session
+
     def login_call(self):
         return call(
             "/api/v1/auth/login",
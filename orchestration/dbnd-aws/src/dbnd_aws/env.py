@@ -37,18 +37,17 @@ class AwsEnvConfig(EnvConfig):
         if not self.update_env_with_boto_creds:
             return
 
-        boto_session = get_boto_session()
-        creds = boto_session.get_credentials()
-
         access_key_env = "AWS_ACCESS_KEY_ID"
         secret_key_env = "AWS_SECRET_ACCESS_KEY"  # pragma: allowlist secret
         token_key_env = "AWS_SESSION_TOKEN"
-        if (
-            creds.access_key
-            and creds.secret_key
-            and access_key_env not in environ
-            and secret_key_env not in environ
-        ):
+        if access_key_env in environ or secret_key_env in environ:
+            # we never override existing keys,
+            # no need to resolve boto credentials (may query instance metadata)
+            return
+
+        boto_session = get_boto_session()
+        creds = boto_session.get_credentials()
+        if creds.access_key and creds.secret_key:
             environ[access_key_env] = creds.access_key
             environ[secret_key_env] = creds.secret_key
             if creds.token:
@@ -3,14 +3,15 @@
 import logging
 
 from dbnd._core.plugin.dbnd_plugins import use_airflow_connections
-from dbnd._core.utils.basics.memoized import per_thread_cached
+from dbnd._core.utils.basics.memoized import cached
 from dbnd_azure.env import AzureCredentialsConfig
 
 
 logger = logging.getLogger(__name__)
 
 
-@per_thread_cached()
+# returns a plain dict of connection settings - safe to share between threads
+@cached()
 def get_azure_credentials():
     if use_airflow_connections():
         from dbnd_run.airflow.dbnd_airflow_contrib.credentials_helper_azure import (
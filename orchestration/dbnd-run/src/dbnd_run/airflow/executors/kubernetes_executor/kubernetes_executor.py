@@ -25,7 +25,7 @@ import os
 import typing
 import uuid
 
-from queue import Empty
+from queue import Empty, Queue
 
 from airflow.utils.db import provide_session
 from kubernetes.client.rest import ApiException
@@ -98,8 +98,11 @@ class DbndKubernetesExecutor(KubernetesExecutor):
         # https://github.com/kubernetes-client/python/blob/master/kubernetes/docs
         # /CoreV1Api.md#list_namespaced_pod
         # KubeResourceVersion.reset_resource_version()
-        self.task_queue = self._manager.Queue()
-        self.result_queue = self._manager.Queue()
+        # task/result queues are only used by this process (executor and scheduler),
+        # no need to proxy every put/get through the multiprocessing manager.
+        # watcher_queue is shared with the watcher subprocess and stays managed
+        self.task_queue = Queue()
+        self.result_queue = Queue()
 
         self.kube_client = self.kube_dbnd.kube_client
         self.kube_scheduler = DbndKubernetesScheduler(
@@ -189,7 +192,7 @@ class DbndKubernetesExecutor(KubernetesExecutor):
                     self.log.warning(
                         "HTTPError when attempting to run task, re-queueing. "
                         "Exception: %s",
-                        str(e),
+                        e,
                     )
                     self.task_queue.put(task)
                 finally:
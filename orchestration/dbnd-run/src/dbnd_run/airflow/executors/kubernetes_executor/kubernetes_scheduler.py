@@ -282,8 +282,8 @@ class DbndKubernetesScheduler(AirflowKubernetesScheduler):
         self.log.debug(
             "Kube POD to submit: image=%s with %s [%s]",
             self.kube_config.kube_image,
-            str(key),
-            str(command),
+            key,
+            command,
         )
 
         databand_run = try_get_databand_run()
@@ -371,7 +371,7 @@ class DbndKubernetesScheduler(AirflowKubernetesScheduler):
         Clean up of all running pods on terminate:
         """
         # now we need to clean after the run
-        pods_to_delete = sorted(list(self.submitted_pods.values()))
+        pods_to_delete = sorted(self.submitted_pods.values())
         if not pods_to_delete:
             return
 
@@ -186,14 +186,11 @@ class DbndKubernetesJobWatcher(KubernetesJobWatcher):
                 self.resource_version = task.metadata.resource_version
 
             except Exception as e:
-                msg = "Event: Exception raised on specific event: %s, Exception: %s" % (
-                    event,
-                    e,
-                )
+                msg = "Event: Exception raised on specific event: %s, Exception: %s"
                 if is_verbose():
-                    self.log.exception(msg)
+                    self.log.exception(msg, event, e)
                 else:
-                    self.log.warning(msg)
+                    self.log.warning(msg, event, e)
         return self.resource_version
 
     def _extended_process_state(self, event):
@@ -260,7 +257,7 @@ class DbndKubernetesJobWatcher(KubernetesJobWatcher):
                 pod_ctrl.check_deploy_errors(pod_data)
                 self.log.info("%s: pod is Pending", event_msg)
             except Exception as ex:
-                self.log.error("Event: %s Pending: failing with %s", pod_id, str(ex))
+                self.log.error("Event: %s Pending: failing with %s", pod_id, ex)
                 self.watcher_queue.put(_fail_event)
 
         elif phase == "Running":
@@ -274,7 +271,7 @@ class DbndKubernetesJobWatcher(KubernetesJobWatcher):
                 self.watcher_queue.put(pod_event.as_tuple_with_state(State.RUNNING))
 
             except Exception as ex:
-                self.log.error("Event: %s Pending: failing with %s", pod_id, str(ex))
+                self.log.error("Event: %s Pending: failing with %s", pod_id, ex)
                 self.watcher_queue.put(pod_event.as_tuple_with_state(State.FAILED))
 
         elif phase == "Failed":
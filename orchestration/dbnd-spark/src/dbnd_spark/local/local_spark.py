@@ -1,10 +1,8 @@
 # © Copyright Databand.ai, an IBM Company 2022
 
-import os
 import re
 
-from io import StringIO
-from logging import StreamHandler
+from logging import Handler
 
 from dbnd._core.errors.friendly_error.task_execution import (
     failed_spark_status,
@@ -17,6 +15,27 @@ from dbnd_spark.local.local_spark_config import SparkLocalEngineConfig
 from dbnd_spark.spark_ctrl import SparkCtrl
 
 
+# spark-submit hook failure message ends with "Error code is: <returncode>."
+_SPARK_ERROR_CODE_RE = re.compile(r"Error code is: (-?[0-9]+)\.")
+
+
+class _SubmitLogLinesHandler(Handler):
+    """
+    Keeps spark-submit log as a list of lines, ready for the spark log parser
+    (no need to join everything into one big string and split it back)
+    """
+
+    def __init__(self):
+        super(_SubmitLogLinesHandler, self).__init__()
+        self.lines = []
+
+    def emit(self, record):
+        try:
+            self.lines.extend(self.format(record).splitlines())
+        except Exception:
+            self.handleError(record)
+
+
 class LocalSparkExecutionCtrl(SparkCtrl):
     def run_pyspark(self, pyspark_script):
         jars = list(self.config.jars)
@@ -76,39 +95,33 @@ class LocalSparkExecutionCtrl(SparkCtrl):
             # take conn information from spark config
             spark.set_connection(spark_local_config.conn_uri)
 
-        log_buffer = StringIO()
-        with log_buffer as lb:
-            dbnd_log_handler = self._capture_submit_log(spark, lb)
-            try:
-                # sync the application file to remote if needed
-                spark.submit(application=deploy.sync(application))
-            except SparkException as ex:
-                return_code = self._get_spark_return_code_from_exception(ex)
-                if return_code != "0":
-                    error_snippets = parse_spark_log_safe(
-                        log_buffer.getvalue().split(os.linesep)
-                    )
-                    raise failed_to_run_spark_script(
-                        self,
-                        spark._build_spark_submit_command(application=application),
-                        application,
-                        return_code,
-                        error_snippets,
-                    )
-                else:
-                    raise failed_spark_status(ex)
-            finally:
-                spark.log.handlers = [
-                    h for h in spark.log.handlers if not dbnd_log_handler
-                ]
-
-    def _capture_submit_log(self, spark, log_buffer):
-        ch = StreamHandler(log_buffer)
+        dbnd_log_handler = self._capture_submit_log(spark)
+        try:
+            # sync the application file to remote if needed
+            spark.submit(application=deploy.sync(application))
+        except SparkException as ex:
+            return_code = self._get_spark_return_code_from_exception(ex)
+            if return_code != "0":
+                error_snippets = parse_spark_log_safe(dbnd_log_handler.lines)
+                raise failed_to_run_spark_script(
+                    self,
+                    spark._build_spark_submit_command(application=application),
+                    application,
+                    return_code,
+                    error_snippets,
+                )
+            else:
+                raise failed_spark_status(ex)
+        finally:
+            spark.log.removeHandler(dbnd_log_handler)
+
+    def _capture_submit_log(self, spark):
+        ch = _SubmitLogLinesHandler()
         spark.log.addHandler(ch)
         return ch
 
     def _get_spark_return_code_from_exception(self, exception):
-        match = re.search("Error code is: ([0-9+]).", str(exception))
+        match = _SPARK_ERROR_CODE_RE.search(str(exception))
         if match:
             return match.groups()[0]
         # assume spark_submit success otherwise
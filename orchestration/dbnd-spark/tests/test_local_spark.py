@@ -0,0 +1,56 @@
+# © Copyright Databand.ai, an IBM Company 2022
+
+import logging
+
+import mock
+import pytest
+
+from dbnd_spark._vendor.airflow.spark_hook import SparkException
+from dbnd_spark.local.local_spark import LocalSparkExecutionCtrl
+
+
+class FailingSparkSubmitHook(object):
+    def __init__(self, **kwargs):
+        self.log = logging.getLogger("test_local_spark.spark_submit_hook")
+
+    def set_connection(self, uri):
+        pass
+
+    def submit(self, application):
+        self.log.error("java.lang.RuntimeError: spark driver failed")
+        raise SparkException("Cannot execute: spark-submit. Error code is: 1.")
+
+    def _build_spark_submit_command(self, application):
+        return ["spark-submit", application]
+
+
+class TestLocalSparkExecutionCtrl(object):
+    @mock.patch(
+        "dbnd_spark._vendor.airflow.spark_hook.SparkSubmitHook", FailingSparkSubmitHook
+    )
+    @mock.patch(
+        "dbnd_spark.local.local_spark.is_dbnd_run_airflow_enabled", return_value=False
+    )
+    @mock.patch("dbnd_spark.local.local_spark.SparkLocalEngineConfig")
+    @mock.patch("dbnd_spark.local.local_spark.failed_to_run_spark_script")
+    def test_submit_failure_keeps_existing_log_handlers(
+        self, failed_to_run_spark_script, _, __
+    ):
+        failed_to_run_spark_script.return_value = Exception("spark failed")
+        spark_log = logging.getLogger("test_local_spark.spark_submit_hook")
+        existing_handler = logging.NullHandler()
+        spark_log.addHandler(existing_handler)
+        try:
+            task_run = mock.MagicMock()
+            task_run.task.spark_config.disable_sync = False
+            ctrl = LocalSparkExecutionCtrl(task_run)
+
+            with mock.patch.object(ctrl, "_get_env_vars", return_value={}):
+                with pytest.raises(Exception, match="spark failed"):
+                    ctrl._run_spark_submit(application="app.py", jars=[])
+
+            assert spark_log.handlers == [existing_handler]
+            error_snippets = failed_to_run_spark_script.call_args[0][4]
+            assert "spark driver failed" in error_snippets[0]
+        finally:
+            spark_log.removeHandler(existing_handler)